@@ -127,7 +127,11 @@ class ContextChatEngine(BaseChatEngine):
         return self._context_template.format(context_str=context_str), nodes
 
     def _get_prefix_messages_with_context(self, context_str: str) -> List[ChatMessage]:
-        """Get the prefix messages with context."""
+        """Get the prefix messages with context.
+
+        Always returns a new list, so callers can extend it with the chat
+        history in place instead of concatenating into another copy.
+        """
         # ensure we grab the user-configured system prompt
         system_prompt = ""
         prefix_messages = self._prefix_messages
@@ -153,8 +157,9 @@ class ContextChatEngine(BaseChatEngine):
         self._memory.put(ChatMessage(content=message, role="user"))
 
         context_str_template, nodes = self._generate_context(message)
-        prefix_messages = self._get_prefix_messages_with_context(context_str_template)
-        all_messages = prefix_messages + self._memory.get()
+        all_messages = self._get_prefix_messages_with_context(context_str_template)
+        system_message = all_messages[0]
+        all_messages.extend(self._memory.get())
 
         chat_response = self._llm.chat(all_messages)
         ai_message = chat_response.message
@@ -165,9 +170,9 @@ class ContextChatEngine(BaseChatEngine):
             sources=[
                 ToolOutput(
                     tool_name="retriever",
-                    content=str(prefix_messages[0]),
+                    content=str(system_message),
                     raw_input={"message": message},
-                    raw_output=prefix_messages[0],
+                    raw_output=system_message,
                 )
             ],
             source_nodes=nodes,
@@ -182,17 +187,18 @@ class ContextChatEngine(BaseChatEngine):
         self._memory.put(ChatMessage(content=message, role="user"))
 
         context_str_template, nodes = self._generate_context(message)
-        prefix_messages = self._get_prefix_messages_with_context(context_str_template)
-        all_messages = prefix_messages + self._memory.get()
+        all_messages = self._get_prefix_messages_with_context(context_str_template)
+        system_message = all_messages[0]
+        all_messages.extend(self._memory.get())
 
         chat_response = StreamingAgentChatResponse(
             chat_stream=self._llm.stream_chat(all_messages),
             sources=[
                 ToolOutput(
                     tool_name="retriever",
-                    content=str(prefix_messages[0]),
+                    content=str(system_message),
                     raw_input={"message": message},
-                    raw_output=prefix_messages[0],
+                    raw_output=system_message,
                 )
             ],
             source_nodes=nodes,
@@ -213,8 +219,9 @@ class ContextChatEngine(BaseChatEngine):
         self._memory.put(ChatMessage(content=message, role="user"))
 
         context_str_template, nodes = await self._agenerate_context(message)
-        prefix_messages = self._get_prefix_messages_with_context(context_str_template)
-        all_messages = prefix_messages + self._memory.get()
+        all_messages = self._get_prefix_messages_with_context(context_str_template)
+        system_message = all_messages[0]
+        all_messages.extend(self._memory.get())
 
         chat_response = await self._llm.achat(all_messages)
         ai_message = chat_response.message
@@ -225,9 +232,9 @@ class ContextChatEngine(BaseChatEngine):
             sources=[
                 ToolOutput(
                     tool_name="retriever",
-                    content=str(prefix_messages[0]),
+                    content=str(system_message),
                     raw_input={"message": message},
-                    raw_output=prefix_messages[0],
+                    raw_output=system_message,
                 )
             ],
             source_nodes=nodes,
@@ -242,17 +249,18 @@ class ContextChatEngine(BaseChatEngine):
         self._memory.put(ChatMessage(content=message, role="user"))
 
         context_str_template, nodes = await self._agenerate_context(message)
-        prefix_messages = self._get_prefix_messages_with_context(context_str_template)
-        all_messages = prefix_messages + self._memory.get()
+        all_messages = self._get_prefix_messages_with_context(context_str_template)
+        system_message = all_messages[0]
+        all_messages.extend(self._memory.get())
 
         chat_response = StreamingAgentChatResponse(
             achat_stream=await self._llm.astream_chat(all_messages),
             sources=[
                 ToolOutput(
                     tool_name="retriever",
-                    content=str(prefix_messages[0]),
+                    content=str(system_message),
                     raw_input={"message": message},
-                    raw_output=prefix_messages[0],
+                    raw_output=system_message,
                 )
             ],
             source_nodes=nodes,
@@ -3,7 +3,7 @@
 import asyncio
 from abc import abstractmethod
 from enum import Enum
-from typing import Callable, Coroutine, List, Optional, Tuple
+from typing import Callable, Coroutine, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -32,21 +32,56 @@ def mean_agg(embeddings: List[Embedding]) -> Embedding:
     return list(np.array(embeddings).mean(axis=0))
 
 
+def _cosine_similarity(embedding1: Embedding, embedding2: Embedding) -> float:
+    product = np.dot(embedding1, embedding2)
+    norm = np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
+    return product / norm
+
+
+def _dot_product_similarity(embedding1: Embedding, embedding2: Embedding) -> float:
+    return np.dot(embedding1, embedding2)
+
+
+def _euclidean_similarity(embedding1: Embedding, embedding2: Embedding) -> float:
+    # Using -euclidean distance as similarity to achieve same ranking order
+    return -float(np.linalg.norm(np.array(embedding1) - np.array(embedding2)))
+
+
+_SIMILARITY_FNS: Dict[str, Callable[[Embedding, Embedding], float]] = {
+    SimilarityMode.DEFAULT: _cosine_similarity,
+    SimilarityMode.DOT_PRODUCT: _dot_product_similarity,
+    SimilarityMode.EUCLIDEAN: _euclidean_similarity,
+}
+
+
 def similarity(
     embedding1: Embedding,
     embedding2: Embedding,
     mode: SimilarityMode = SimilarityMode.DEFAULT,
 ) -> float:
     """Get embedding similarity."""
+    return _SIMILARITY_FNS.get(mode, _cosine_similarity)(embedding1, embedding2)
+
+
+def similarity_batch(
+    query_embedding: np.ndarray,
+    embeddings: np.ndarray,
+    mode: SimilarityMode = SimilarityMode.DEFAULT,
+) -> np.ndarray:
+    """Get the similarity of a query embedding against a matrix of embeddings.
+
+    Equivalent to calling `similarity` on each row of `embeddings`, but computed
+    with a single matrix product.
+    """
     if mode == SimilarityMode.EUCLIDEAN:
-        # Using -euclidean distance as similarity to achieve same ranking order
-        return -float(np.linalg.norm(np.array(embedding1) - np.array(embedding2)))
-    elif mode == SimilarityMode.DOT_PRODUCT:
-        return np.dot(embedding1, embedding2)
-    else:
-        product = np.dot(embedding1, embedding2)
-        norm = np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
-        return product / norm
+        return -np.linalg.norm(embeddings - query_embedding, axis=1)
+
+    products = embeddings @ query_embedding
+    if mode == SimilarityMode.DOT_PRODUCT:
+        return products
+
+    norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_embedding)
+    return products / norms
 
 
 class BaseEmbedding(BaseComponent):
@@ -6,6 +6,7 @@ from typing import Any, Callable, List, Optional, Tuple
 import numpy as np
 
 from llama_index.embeddings.base import similarity as default_similarity_fn
+from llama_index.embeddings.base import similarity_batch
 from llama_index.vector_stores.types import VectorStoreQueryMode
 
 
@@ -21,14 +22,19 @@ def get_top_k_embeddings(
     if embedding_ids is None:
         embedding_ids = list(range(len(embeddings)))
 
-    similarity_fn = similarity_fn or default_similarity_fn
-
     embeddings_np = np.array(embeddings)
     query_embedding_np = np.array(query_embedding)
 
+    similarities: List[float]
+    if similarity_fn is None and len(embeddings) > 0:
+        # score every embedding at once instead of one python call per row
+        similarities = similarity_batch(query_embedding_np, embeddings_np).tolist()
+    else:
+        similarity_fn = similarity_fn or default_similarity_fn
+        similarities = [similarity_fn(query_embedding_np, emb) for emb in embeddings_np]
+
     similarity_heap: List[Tuple[float, Any]] = []
-    for i, emb in enumerate(embeddings_np):
-        similarity = similarity_fn(query_embedding_np, emb)
+    for i, similarity in enumerate(similarities):
         if similarity_cutoff is None or similarity > similarity_cutoff:
             heapq.heappush(similarity_heap, (similarity, embedding_ids[i]))
             if similarity_top_k and len(similarity_heap) > similarity_top_k:
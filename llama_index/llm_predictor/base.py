@@ -1,9 +1,10 @@
 """Wrapper functions around an LLM chain."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from collections import ChainMap
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from llama_index.bridge.pydantic import BaseModel, PrivateAttr
 from llama_index.callbacks.base import CallbackManager
@@ -22,6 +23,8 @@ from llama_index.types import TokenAsyncGen, TokenGen
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class BaseLLMPredictor(BaseComponent, ABC):
     """Base LLM Predictor."""
@@ -59,6 +62,50 @@ class BaseLLMPredictor(BaseComponent, ABC):
     ) -> TokenAsyncGen:
         """Async predict the answer to a query."""
 
+    async def abatch_predict(
+        self,
+        prompts: List[BasePromptTemplate],
+        prompt_args_list: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[str]:
+        """Async predict the answers to a batch of prompts.
+
+        Requests are issued concurrently, with at most `max_concurrency` in
+        flight at once. Outputs are returned in the same order as `prompts`.
+        """
+        if prompt_args_list is None:
+            prompt_args_list = [{} for _ in prompts]
+        if len(prompt_args_list) != len(prompts):
+            raise ValueError("prompts and prompt_args_list must have the same length.")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _predict(prompt: BasePromptTemplate, prompt_args: Dict) -> str:
+            async with semaphore:
+                return await self.apredict(prompt, **prompt_args)
+
+        return await asyncio.gather(
+            *[
+                _predict(prompt, prompt_args)
+                for prompt, prompt_args in zip(prompts, prompt_args_list)
+            ]
+        )
+
+    def batch_predict(
+        self,
+        prompts: List[BasePromptTemplate],
+        prompt_args_list: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[str]:
+        """Predict the answers to a batch of prompts concurrently."""
+        return asyncio.run(
+            self.abatch_predict(
+                prompts,
+                prompt_args_list=prompt_args_list,
+                max_concurrency=max_concurrency,
+            )
+        )
+
 
 class LLMPredictor(BaseLLMPredictor):
     """LLM predictor class.
@@ -77,6 +124,7 @@ class LLMPredictor(BaseLLMPredictor):
     system_prompt: Optional[str]
     query_wrapper_prompt: Optional[BasePromptTemplate]
     _llm: LLM = PrivateAttr()
+    _system_message: Optional[ChatMessage] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -117,6 +165,15 @@ class LLMPredictor(BaseLLMPredictor):
     def _log_template_data(
         self, prompt: BasePromptTemplate, **prompt_args: Any
     ) -> None:
+        # NOTE: building the payload renders the template, so skip it entirely
+        # when no handler would receive a templating event
+        if not any(
+            CBEventType.TEMPLATING not in handler.event_starts_to_ignore
+            or CBEventType.TEMPLATING not in handler.event_ends_to_ignore
+            for handler in self.callback_manager.handlers
+        ):
+            return
+
         template_vars = {
             k: v
             for k, v in ChainMap(prompt.kwargs, prompt_args).items()
@@ -218,6 +275,9 @@ class LLMPredictor(BaseLLMPredictor):
         """Async predict."""
         self._log_template_data(prompt, **prompt_args)
 
+        # NOTE: prompt formatting stays on the event loop on purpose. It is only a
+        # few str.format calls, which is cheaper than handing the work off to a
+        # thread executor.
         if output_cls is not None:
             output = await self._arun_program(output_cls, prompt, **prompt_args)
         elif self._llm.metadata.is_chat_model:
@@ -275,11 +335,23 @@ class LLMPredictor(BaseLLMPredictor):
 
         return extended_prompt
 
+    def _get_system_message(self) -> ChatMessage:
+        """Get the system prompt as a chat message.
+
+        The same message is reused across calls so every request starts with an
+        identical system block, and only rebuilt if the system prompt changes.
+        """
+        if (
+            self._system_message is None
+            or self._system_message.content != self.system_prompt
+        ):
+            self._system_message = ChatMessage(
+                role=MessageRole.SYSTEM, content=self.system_prompt
+            )
+        return self._system_message
+
     def _extend_messages(self, messages: List[ChatMessage]) -> List[ChatMessage]:
         """Add system prompt to chat message list."""
         if self.system_prompt:
-            messages = [
-                ChatMessage(role=MessageRole.SYSTEM, content=self.system_prompt),
-                *messages,
-            ]
+            messages = [self._get_system_message(), *messages]
         return messages
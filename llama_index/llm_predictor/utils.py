@@ -1,3 +1,6 @@
+import asyncio
+from typing import List, Optional
+
 from llama_index.llms.base import (
     ChatResponseAsyncGen,
     ChatResponseGen,
@@ -53,3 +56,56 @@ async def astream_chat_response_to_tokens(
             yield response.delta or ""
 
     return gen()
+
+
+async def abatch_tokens(
+    token_gen: TokenAsyncGen,
+    max_tokens: int = 8,
+    max_delay_ms: float = 15,
+) -> TokenAsyncGen:
+    """Coalesce a stream of tokens into larger chunks.
+
+    Buffered tokens are flushed as one string once `max_tokens` have been
+    collected, or once `max_delay_ms` has passed since the first buffered token,
+    whichever comes first.
+    """
+
+    async def gen() -> TokenAsyncGen:
+        loop = asyncio.get_running_loop()
+        buffer: List[str] = []
+        deadline: Optional[float] = None
+        # NOTE: the pending __anext__ is kept across timeouts rather than cancelled,
+        # since cancelling it would close the underlying generator
+        next_token: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if next_token is None:
+                    next_token = asyncio.ensure_future(token_gen.__anext__())
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait({next_token}, timeout=timeout)
+                if not done:
+                    yield "".join(buffer)
+                    buffer, deadline = [], None
+                    continue
+
+                try:
+                    token = next_token.result()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    next_token = None
+
+                buffer.append(token)
+                if deadline is None:
+                    deadline = loop.time() + max_delay_ms / 1000
+                if len(buffer) >= max_tokens:
+                    yield "".join(buffer)
+                    buffer, deadline = [], None
+
+            if buffer:
+                yield "".join(buffer)
+        finally:
+            if next_token is not None:
+                next_token.cancel()
+
+    return gen()
@@ -1,4 +1,7 @@
-from typing import Any, Dict, Optional, Sequence
+import asyncio
+import json
+import weakref
+from typing import Any, Dict, Optional, Sequence, Union
 
 from llama_index.bridge.pydantic import Field, PrivateAttr
 from llama_index.callbacks import CallbackManager
@@ -6,20 +9,48 @@ from llama_index.constants import DEFAULT_NUM_OUTPUTS
 from llama_index.llms.base import (
     ChatMessage,
     ChatResponse,
+    ChatResponseAsyncGen,
     ChatResponseGen,
     CompletionResponse,
+    CompletionResponseAsyncGen,
     CompletionResponseGen,
     LLMMetadata,
+    MessageRole,
     llm_chat_callback,
     llm_completion_callback,
 )
 from llama_index.llms.custom import CustomLLM
-from llama_index.llms.generic_utils import chat_to_completion_decorator
+from llama_index.llms.generic_utils import (
+    achat_to_completion_decorator,
+    astream_chat_to_completion_decorator,
+    chat_to_completion_decorator,
+    stream_chat_to_completion_decorator,
+)
 from llama_index.llms.openai_utils import (
     from_openai_message_dict,
     to_openai_message_dicts,
 )
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class LlamaAPI(CustomLLM):
     model: str = Field(description="The llama-api model to use.")
@@ -30,6 +61,7 @@ class LlamaAPI(CustomLLM):
     )
 
     _client: Any = PrivateAttr()
+    _async_clients: Any = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
 
     def __init__(
         self,
@@ -62,16 +94,18 @@ class LlamaAPI(CustomLLM):
     def class_name(cls) -> str:
         return "llama_api_llm"
 
-    @property
-    def _model_kwargs(self) -> Dict[str, Any]:
-        base_kwargs = {
+    def _get_request_dict(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> Dict[str, Any]:
+        # NOTE: build the request body as a single dict, rather than merging
+        # intermediate model kwargs dicts on every call
+        return {
+            "messages": to_openai_message_dicts(messages),
             "model": self.model,
             "temperature": self.temperature,
             "max_length": self.max_tokens,
-        }
-        return {
-            **base_kwargs,
             **self.additional_kwargs,
+            **kwargs,
         }
 
     @property
@@ -84,31 +118,171 @@ class LlamaAPI(CustomLLM):
             model_name="llama-api",
         )
 
-    @llm_chat_callback()
-    def chat(self, messages: Sequence[ChatMessage], **kwargs: Any) -> ChatResponse:
-        message_dicts = to_openai_message_dicts(messages)
-        json_dict = {
-            "messages": message_dicts,
-            **self._model_kwargs,
-            **kwargs,
-        }
-        response = self._client.run(json_dict).json()
+    def _get_async_client(self) -> Any:
+        """Get the async http client for the running event loop.
+
+        One client is shared by all calls on the same loop, so that concurrent
+        calls reuse pooled connections. Clients are not shared across loops, as
+        their connections are bound to the loop that opened them.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "Async LlamaAPI calls require httpx to be installed.\n"
+                    "Please install httpx with `pip install httpx`."
+                )
+            # NOTE: open connections reference their loop, which keeps it alive as a
+            # weak key, so drop the clients of loops that have closed since
+            for closed_loop in [key for key in self._async_clients if key.is_closed()]:
+                del self._async_clients[closed_loop]
+            # NOTE: no timeout, to match the sync llamaapi client
+            client = httpx.AsyncClient(
+                base_url=self._client.hostname,
+                headers=self._client.headers,
+                timeout=None,
+            )
+            self._async_clients[loop] = client
+        return client
+
+    @staticmethod
+    def _parse_sse_line(line: str) -> Optional[Dict[str, Any]]:
+        """Parse a server-sent event line into a response chunk, if it has one."""
+        if not line.startswith("data:"):
+            return None
+        data = line[len("data:") :].strip()
+        if not data or data == "[DONE]":
+            return None
+        return _json_loads(data)
+
+    @staticmethod
+    def _to_chat_response_delta(
+        chunk: Dict[str, Any], content: str
+    ) -> Optional[ChatResponse]:
+        """Convert a streamed chunk into a response, given the content so far."""
+        if len(chunk.get("choices", [])) == 0:
+            return None
+        delta = chunk["choices"][0].get("delta", {})
+        role = delta.get("role", MessageRole.ASSISTANT)
+        content_delta = delta.get("content", "") or ""
+        return ChatResponse(
+            message=ChatMessage(role=role, content=content + content_delta),
+            delta=content_delta,
+            raw=chunk,
+        )
+
+    def _to_chat_response(self, response: Dict[str, Any]) -> ChatResponse:
         message_dict = response["choices"][0]["message"]
         message = from_openai_message_dict(message_dict)
 
         return ChatResponse(message=message, raw=response)
 
+    @llm_chat_callback()
+    def chat(self, messages: Sequence[ChatMessage], **kwargs: Any) -> ChatResponse:
+        json_dict = self._get_request_dict(messages, **kwargs)
+        response = self._client.run(json_dict).json()
+        return self._to_chat_response(response)
+
     @llm_completion_callback()
     def complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
         complete_fn = chat_to_completion_decorator(self.chat)
         return complete_fn(prompt, **kwargs)
 
+    @llm_chat_callback()
+    async def achat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        json_dict = self._get_request_dict(messages, **kwargs)
+        response = await self._get_async_client().post(
+            self._client.domain_path,
+            content=_json_dumps(json_dict),
+            headers=JSON_HEADERS,
+        )
+        if response.status_code != 200:
+            raise ValueError(
+                f"POST {response.status_code} {response.json().get('detail')}"
+            )
+        return self._to_chat_response(_json_loads(response.content))
+
     @llm_completion_callback()
-    def stream_complete(self, prompt: str, **kwargs: Any) -> CompletionResponseGen:
-        raise NotImplementedError("stream_complete is not supported for LlamaAPI")
+    async def acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        acomplete_fn = achat_to_completion_decorator(self.achat)
+        return await acomplete_fn(prompt, **kwargs)
 
     @llm_chat_callback()
     def stream_chat(
         self, messages: Sequence[ChatMessage], **kwargs: Any
     ) -> ChatResponseGen:
-        raise NotImplementedError("stream_chat is not supported for LlamaAPI")
+        import requests
+
+        json_dict = self._get_request_dict(messages, stream=True, **kwargs)
+
+        def gen() -> ChatResponseGen:
+            with requests.post(
+                f"{self._client.hostname}{self._client.domain_path}",
+                headers={**self._client.headers, **JSON_HEADERS},
+                data=_json_dumps(json_dict),
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    raise ValueError(
+                        f"POST {response.status_code} {response.json().get('detail')}"
+                    )
+                content = ""
+                for line in response.iter_lines():
+                    chunk = self._parse_sse_line(line.decode("utf-8"))
+                    if chunk is None:
+                        continue
+                    chat_response = self._to_chat_response_delta(chunk, content)
+                    if chat_response is None:
+                        continue
+                    content = chat_response.message.content or ""
+                    yield chat_response
+
+        return gen()
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, **kwargs: Any) -> CompletionResponseGen:
+        stream_complete_fn = stream_chat_to_completion_decorator(self.stream_chat)
+        return stream_complete_fn(prompt, **kwargs)
+
+    @llm_chat_callback()
+    async def astream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseAsyncGen:
+        json_dict = self._get_request_dict(messages, stream=True, **kwargs)
+
+        async def gen() -> ChatResponseAsyncGen:
+            async with self._get_async_client().stream(
+                "POST",
+                self._client.domain_path,
+                content=_json_dumps(json_dict),
+                headers=JSON_HEADERS,
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise ValueError(
+                        f"POST {response.status_code} {response.json().get('detail')}"
+                    )
+                content = ""
+                async for line in response.aiter_lines():
+                    chunk = self._parse_sse_line(line)
+                    if chunk is None:
+                        continue
+                    chat_response = self._to_chat_response_delta(chunk, content)
+                    if chat_response is None:
+                        continue
+                    content = chat_response.message.content or ""
+                    yield chat_response
+
+        return gen()
+
+    @llm_completion_callback()
+    async def astream_complete(
+        self, prompt: str, **kwargs: Any
+    ) -> CompletionResponseAsyncGen:
+        astream_complete_fn = astream_chat_to_completion_decorator(self.astream_chat)
+        return await astream_complete_fn(prompt, **kwargs)
@@ -1,9 +1,29 @@
 """Node parser interface."""
+import asyncio
+import contextvars
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, List, Sequence
+from itertools import chain
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
 
 from llama_index.schema import BaseComponent, BaseNode, Document
 
+DEFAULT_MAX_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+async def _run_in_thread(fn: Callable[..., T], *args: Any) -> T:
+    """Run a sync function in a worker thread, in a copy of the current context.
+
+    The copy carries over contextvars such as the callback trace stack, so events
+    emitted by `fn` nest under the caller's open event (like `asyncio.to_thread`,
+    which is not available on python 3.8).
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(ctx.run, fn, *args))
+
 
 class NodeParser(BaseComponent, ABC):
     """Base interface for node parser."""
@@ -24,6 +44,42 @@ class NodeParser(BaseComponent, ABC):
 
         """
 
+    async def aget_nodes_from_documents(
+        self,
+        documents: Sequence[Document],
+        show_progress: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[BaseNode]:
+        """Asynchronously parse documents into nodes.
+
+        By default each document is parsed with `get_nodes_from_documents` in a
+        worker thread, with at most `max_concurrency` documents in flight.
+        Subclasses with natively async dependencies can override this.
+
+        Args:
+            documents (Sequence[Document]): documents to parse
+            show_progress (bool): show a progress bar over parsed documents
+            max_concurrency (int): maximum number of documents parsed at once
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _parse(document: Document) -> List[BaseNode]:
+            async with semaphore:
+                return await _run_in_thread(self.get_nodes_from_documents, [document])
+
+        if show_progress:
+            from tqdm.asyncio import tqdm_asyncio
+
+            async_module = tqdm_asyncio
+        else:
+            async_module = asyncio
+
+        nodes_per_document = await async_module.gather(
+            *[_parse(document) for document in documents]
+        )
+        return list(chain.from_iterable(nodes_per_document))
+
 
 class BaseExtractor(BaseComponent, ABC):
     """Base interface for feature extractor."""
@@ -41,3 +97,16 @@ class BaseExtractor(BaseComponent, ABC):
         Args:
             nodes (List[BaseNode]): nodes to extract from
         """
+
+    async def aextract(
+        self,
+        nodes: List[BaseNode],
+    ) -> List[Dict]:
+        """Asynchronously extract metadata from nodes.
+
+        Defaults to running `extract` in a worker thread.
+
+        Args:
+            nodes (List[BaseNode]): nodes to extract from
+        """
+        return await _run_in_thread(self.extract, nodes)
@@ -11,6 +11,8 @@ OT = TypeVar("OT")
 class BaseObjectNodeMapping(Generic[OT]):
     """Base object node mapping."""
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_objects(
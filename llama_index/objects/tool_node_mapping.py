@@ -1,11 +1,12 @@
 """Tool mapping."""
 
-from typing import Any, Optional, Sequence
+from dataclasses import replace
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
 
 from llama_index.objects.base_node_mapping import BaseObjectNodeMapping
 from llama_index.schema import BaseNode, TextNode
 from llama_index.tools.query_engine import QueryEngineTool
-from llama_index.tools.types import BaseTool
+from llama_index.tools.types import BaseTool, ToolMetadata
 
 
 def convert_tool_to_node(tool: BaseTool) -> TextNode:
@@ -24,9 +25,33 @@ def convert_tool_to_node(tool: BaseTool) -> TextNode:
     )
 
 
+def _get_cached_tool_node(
+    tools: Mapping[Optional[str], BaseTool],
+    node_cache: Dict[Optional[str], Tuple[ToolMetadata, TextNode]],
+    tool: BaseTool,
+) -> TextNode:
+    """Convert a tool to a node, reusing the node built for a registered tool.
+
+    Only tools registered in `tools` are cached, and a cached node is rebuilt if
+    the tool's metadata has changed since.
+    """
+    name = tool.metadata.name
+    if name is None or tools.get(name) is not tool:
+        return convert_tool_to_node(tool)
+
+    cached = node_cache.get(name)
+    if cached is None or cached[0] != tool.metadata:
+        # keep a copy, so that in-place metadata edits are detected
+        cached = (replace(tool.metadata), convert_tool_to_node(tool))
+        node_cache[name] = cached
+    return cached[1]
+
+
 class BaseToolNodeMapping(BaseObjectNodeMapping[BaseTool]):
     """Base Tool node mapping."""
 
+    __slots__ = ()
+
     def validate_object(self, obj: BaseTool) -> None:
         if not isinstance(obj, BaseTool):
             raise ValueError(f"Object must be of type {BaseTool}")
@@ -38,11 +63,18 @@ class SimpleToolNodeMapping(BaseToolNodeMapping):
     In this setup, we assume that the tool name is unique, and
     that the list of all tools are stored in memory.
 
+    Nodes of registered tools are built once and shared between `to_node` calls,
+    so they should not be modified.
+
     """
 
+    __slots__ = ("_tools", "_node_cache")
+
     def __init__(self, objs: Optional[Sequence[BaseTool]] = None) -> None:
         objs = objs or []
         self._tools = {tool.metadata.name: tool for tool in objs}
+        # tool name -> (metadata the node was built from, node)
+        self._node_cache: Dict[Optional[str], Tuple[ToolMetadata, TextNode]] = {}
 
     @classmethod
     def from_objects(
@@ -52,10 +84,11 @@ class SimpleToolNodeMapping(BaseToolNodeMapping):
 
     def _add_object(self, tool: BaseTool) -> None:
         self._tools[tool.metadata.name] = tool
+        self._node_cache.pop(tool.metadata.name, None)
 
     def to_node(self, tool: BaseTool) -> TextNode:
         """To node."""
-        return convert_tool_to_node(tool)
+        return _get_cached_tool_node(self._tools, self._node_cache, tool)
 
     def _from_node(self, node: BaseNode) -> BaseTool:
         """From node."""
@@ -67,13 +100,24 @@ class SimpleToolNodeMapping(BaseToolNodeMapping):
 class BaseQueryToolNodeMapping(BaseObjectNodeMapping[QueryEngineTool]):
     """Base query tool node mapping."""
 
+    __slots__ = ()
+
 
 class SimpleQueryToolNodeMapping(BaseQueryToolNodeMapping):
-    """Simple query tool mapping."""
+    """Simple query tool mapping.
+
+    Nodes of registered tools are built once and shared between `to_node` calls,
+    so they should not be modified.
+
+    """
+
+    __slots__ = ("_tools", "_node_cache")
 
     def __init__(self, objs: Optional[Sequence[QueryEngineTool]] = None) -> None:
         objs = objs or []
         self._tools = {tool.metadata.name: tool for tool in objs}
+        # tool name -> (metadata the node was built from, node)
+        self._node_cache: Dict[Optional[str], Tuple[ToolMetadata, TextNode]] = {}
 
     def validate_object(self, obj: QueryEngineTool) -> None:
         if not isinstance(obj, QueryEngineTool):
@@ -89,10 +133,11 @@ class SimpleQueryToolNodeMapping(BaseQueryToolNodeMapping):
         if tool.metadata.name is None:
             raise ValueError("Tool name must be set")
         self._tools[tool.metadata.name] = tool
+        self._node_cache.pop(tool.metadata.name, None)
 
     def to_node(self, obj: QueryEngineTool) -> TextNode:
         """To node."""
-        return convert_tool_to_node(obj)
+        return _get_cached_tool_node(self._tools, self._node_cache, obj)
 
     def _from_node(self, node: BaseNode) -> QueryEngineTool:
         """From node."""
@@ -1,6 +1,6 @@
 """Document store."""
 
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from llama_index.schema import BaseNode, TextNode
 from llama_index.storage.docstore.types import BaseDocumentStore, RefDocInfo
@@ -124,6 +124,27 @@ class KVDocumentStore(BaseDocumentStore):
                 return None
         return json_to_doc(json)
 
+    def get_documents(
+        self, doc_ids: List[str], raise_error: bool = True
+    ) -> List[Optional[BaseNode]]:
+        """Get a list of documents from the store with one kvstore lookup.
+
+        Args:
+            doc_ids (List[str]): document ids
+            raise_error (bool): raise error if a doc_id is not found
+
+        """
+        jsons = self._kvstore.get_many(doc_ids, collection=self._node_collection)
+        docs: List[Optional[BaseNode]] = []
+        for doc_id, json in zip(doc_ids, jsons):
+            if json is None:
+                if raise_error:
+                    raise ValueError(f"doc_id {doc_id} not found.")
+                docs.append(None)
+            else:
+                docs.append(json_to_doc(json))
+        return docs
+
     def get_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
         """Get the RefDocInfo for a given ref_doc_id."""
         ref_doc_info = self._kvstore.get(
@@ -1,7 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, cast
 
 import fsspec
 from dataclasses_json import DataClassJsonMixin
@@ -46,6 +46,18 @@ class BaseDocumentStore(ABC):
     def get_document(self, doc_id: str, raise_error: bool = True) -> Optional[BaseNode]:
         ...
 
+    def get_documents(
+        self, doc_ids: List[str], raise_error: bool = True
+    ) -> List[Optional[BaseNode]]:
+        """Get a list of documents from the store, in order.
+
+        Stores backed by a remote service should override this to fetch all
+        documents in a single round-trip.
+        """
+        return [
+            self.get_document(doc_id, raise_error=raise_error) for doc_id in doc_ids
+        ]
+
     @abstractmethod
     def delete_document(self, doc_id: str, raise_error: bool = True) -> None:
         """Delete a document from the store."""
@@ -88,7 +100,11 @@ class BaseDocumentStore(ABC):
             raise_error (bool): raise error if node_id not found
 
         """
-        return [self.get_node(node_id, raise_error=raise_error) for node_id in node_ids]
+        docs = self.get_documents(node_ids, raise_error=raise_error)
+        for node_id, doc in zip(node_ids, docs):
+            if not isinstance(doc, BaseNode):
+                raise ValueError(f"Document {node_id} is not a Node.")
+        return cast(List[BaseNode], docs)
 
     def get_node(self, node_id: str, raise_error: bool = True) -> BaseNode:
         """Get node from docstore.
@@ -110,6 +126,5 @@ class BaseDocumentStore(ABC):
             node_id_dict (Dict[int, str]): mapping of index to node ids
 
         """
-        return {
-            index: self.get_node(node_id) for index, node_id in node_id_dict.items()
-        }
+        nodes = self.get_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
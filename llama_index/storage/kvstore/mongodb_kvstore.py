@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
@@ -129,6 +129,25 @@ class MongoDBKVStore(BaseKVStore):
             return result
         return None
 
+    def get_many(
+        self, keys: List[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get the values for a list of keys in a single query.
+
+        Args:
+            keys (List[str]): keys
+            collection (str): collection name
+
+        """
+        if not keys:
+            return []
+        results = self._db[collection].find({"_id": {"$in": keys}})
+        output = {}
+        for result in results:
+            key = result.pop("_id")
+            output[key] = result
+        return [output.get(key) for key in keys]
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store.
 
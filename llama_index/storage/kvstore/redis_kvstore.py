@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
@@ -72,6 +72,23 @@ class RedisKVStore(BaseKVStore):
             return None
         return json.loads(val_str)
 
+    def get_many(
+        self, keys: List[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get the values for a list of keys in a single HMGET.
+
+        Args:
+            keys (List[str]): keys
+            collection (str): collection name
+
+        """
+        if not keys:
+            return []
+        val_strs = self._redis_client.hmget(name=collection, keys=keys)
+        return [
+            None if val_str is None else json.loads(val_str) for val_str in val_strs
+        ]
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store."""
         collection_kv_dict = {}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import fsspec
 
@@ -17,6 +17,16 @@ class BaseKVStore(ABC):
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         pass
 
+    def get_many(
+        self, keys: List[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get the values for a list of keys, in order.
+
+        Missing keys map to None. Backends that can fetch several keys in one
+        round-trip should override this.
+        """
+        return [self.get(key, collection=collection) for key in keys]
+
     @abstractmethod
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         pass
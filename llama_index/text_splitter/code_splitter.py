@@ -1,7 +1,7 @@
 """Code splitter."""
 from typing import Any, List, Optional
 
-from llama_index.bridge.pydantic import Field
+from llama_index.bridge.pydantic import Field, PrivateAttr
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.text_splitter.types import TextSplitter
@@ -36,6 +36,8 @@ class CodeSplitter(TextSplitter):
         default_factory=CallbackManager, exclude=True
     )
 
+    _parser: Any = PrivateAttr(default=None)
+
     def __init__(
         self,
         language: str,
@@ -80,11 +82,9 @@ class CodeSplitter(TextSplitter):
             new_chunks.append(current_chunk)
         return new_chunks
 
-    def split_text(self, text: str) -> List[str]:
-        """Split incoming code and return chunks using the AST."""
-        with self.callback_manager.event(
-            CBEventType.CHUNKING, payload={EventPayload.CHUNKS: [text]}
-        ) as event:
+    def _get_parser(self) -> Any:
+        """Get the tree-sitter parser, loading it on first use."""
+        if self._parser is None:
             try:
                 import tree_sitter_languages
             except ImportError:
@@ -93,7 +93,7 @@ class CodeSplitter(TextSplitter):
                 )
 
             try:
-                parser = tree_sitter_languages.get_parser(self.language)
+                self._parser = tree_sitter_languages.get_parser(self.language)
             except Exception as e:
                 print(
                     f"Could not get parser for language {self.language}. Check "
@@ -101,8 +101,14 @@ class CodeSplitter(TextSplitter):
                     "for a list of valid languages."
                 )
                 raise
+        return self._parser
 
-            tree = parser.parse(bytes(text, "utf-8"))
+    def split_text(self, text: str) -> List[str]:
+        """Split incoming code and return chunks using the AST."""
+        with self.callback_manager.event(
+            CBEventType.CHUNKING, payload={EventPayload.CHUNKS: [text]}
+        ) as event:
+            tree = self._get_parser().parse(bytes(text, "utf-8"))
 
             if (
                 not tree.root_node.children
@@ -24,6 +24,7 @@ DEFAULT_PARAGRAPH_SEP = "\n\n\n"
 class _Split:
     text: str  # the split text
     is_sentence: bool  # save whether this is a full sentence
+    token_size: int  # token length of split text
 
 
 class SentenceSplitter(MetadataAwareTextSplitter):
@@ -159,7 +160,9 @@ class SentenceSplitter(MetadataAwareTextSplitter):
 
         return chunks
 
-    def _split(self, text: str, chunk_size: int) -> List[_Split]:
+    def _split(
+        self, text: str, chunk_size: int, token_size: Optional[int] = None
+    ) -> List[_Split]:
         r"""Break text into splits that are smaller than chunk size.
 
         The order of splitting is:
@@ -168,19 +171,30 @@ class SentenceSplitter(MetadataAwareTextSplitter):
         3. split by second chunking regex (default is "[^,\.;]+[,\.;]?")
         4. split by default separator (" ")
 
+        `token_size` is the token length of `text`, if the caller already knows it.
+
         """
-        if self._token_size(text) <= chunk_size:
-            return [_Split(text, is_sentence=True)]
+        if token_size is None:
+            token_size = self._token_size(text)
+        if token_size <= chunk_size:
+            return [_Split(text, is_sentence=True, token_size=token_size)]
 
         text_splits_by_fns, is_sentence = self._get_splits_by_fns(text)
 
         text_splits = []
         for text_split_by_fns in text_splits_by_fns:
-            if self._token_size(text_split_by_fns) <= chunk_size:
-                text_splits.append(_Split(text_split_by_fns, is_sentence=is_sentence))
+            token_size = self._token_size(text_split_by_fns)
+            if token_size <= chunk_size:
+                text_splits.append(
+                    _Split(
+                        text_split_by_fns,
+                        is_sentence=is_sentence,
+                        token_size=token_size,
+                    )
+                )
             else:
                 recursive_text_splits = self._split(
-                    text_split_by_fns, chunk_size=chunk_size
+                    text_split_by_fns, chunk_size=chunk_size, token_size=token_size
                 )
                 text_splits.extend(recursive_text_splits)
         return text_splits
@@ -198,7 +212,6 @@ class SentenceSplitter(MetadataAwareTextSplitter):
 
             chunks.append("".join([text for text, length in cur_chunk]))
             last_chunk = cur_chunk
-            cur_chunk = []
             cur_chunk_len = 0
             new_chunk = True
 
@@ -208,20 +221,21 @@ class SentenceSplitter(MetadataAwareTextSplitter):
             # in theory the correct thing to do would be to remove some/all of the
             # overlap. However, it would complicate the logic further without
             # much real world benefit, so it's not implemented now.
-            if len(last_chunk) > 0:
-                last_index = len(last_chunk) - 1
-                while (
-                    last_index >= 0
-                    and cur_chunk_len + last_chunk[last_index][1] <= self.chunk_overlap
-                ):
-                    text, length = last_chunk[last_index]
-                    cur_chunk_len += length
-                    cur_chunk.insert(0, (text, length))
-                    last_index -= 1
-
-        while len(splits) > 0:
-            cur_split = splits[0]
-            cur_split_len = len(self.tokenizer(cur_split.text))
+            last_index = len(last_chunk) - 1
+            while (
+                last_index >= 0
+                and cur_chunk_len + last_chunk[last_index][1] <= self.chunk_overlap
+            ):
+                cur_chunk_len += last_chunk[last_index][1]
+                last_index -= 1
+            # take the overlap as one slice rather than inserting at the front
+            cur_chunk = last_chunk[last_index + 1 :]
+
+        # walk splits with a cursor; popping from the front is O(n) per split
+        split_idx = 0
+        while split_idx < len(splits):
+            cur_split = splits[split_idx]
+            cur_split_len = cur_split.token_size
             if cur_split_len > chunk_size:
                 raise ValueError("Single token exceeded chunk size")
             if cur_chunk_len + cur_split_len > chunk_size and not new_chunk:
@@ -236,7 +250,7 @@ class SentenceSplitter(MetadataAwareTextSplitter):
                     # add split to chunk
                     cur_chunk_len += cur_split_len
                     cur_chunk.append((cur_split.text, cur_split_len))
-                    splits.pop(0)
+                    split_idx += 1
                     new_chunk = False
                 else:
                     # close out chunk
@@ -73,7 +73,8 @@ def split_by_regex(regex: str) -> Callable[[str], List[str]]:
     """Split text by regex."""
     import re
 
-    return lambda text: re.findall(regex, text)
+    pattern = re.compile(regex)
+    return pattern.findall
 
 
 def split_by_phrase_regex() -> Callable[[str], List[str]]:
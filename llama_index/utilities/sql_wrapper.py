@@ -106,13 +106,20 @@ class SQLDatabase:
         self._max_string_length = max_string_length
 
         self._metadata = metadata or MetaData()
-        # including view support if view_support = true
-        self._metadata.reflect(
-            views=view_support,
-            bind=self._engine,
-            only=list(self._usable_tables),
-            schema=self._schema,
-        )
+        # only reflect tables the metadata does not already describe
+        unreflected_tables = [
+            table
+            for table in self._usable_tables
+            if (f"{schema}.{table}" if schema else table) not in self._metadata.tables
+        ]
+        if unreflected_tables:
+            # including view support if view_support = true
+            self._metadata.reflect(
+                views=view_support,
+                bind=self._engine,
+                only=unreflected_tables,
+                schema=self._schema,
+            )
 
     @property
     def engine(self) -> Engine:
@@ -183,6 +190,14 @@ class SQLDatabase:
         with self._engine.begin() as connection:
             connection.execute(stmt)
 
+    def insert_into_table_many(self, table_name: str, data: List[dict]) -> None:
+        """Insert many rows into a table with a single executemany."""
+        if not data:
+            return
+        table = self._metadata.tables[table_name]
+        with self._engine.begin() as connection:
+            connection.execute(insert(table), data)
+
     def run_sql(self, command: str) -> Tuple[str, Dict]:
         """Execute a SQL statement and return a string representing the results.
 
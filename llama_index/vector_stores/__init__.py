@@ -1,46 +1,91 @@
 """Vector stores."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from llama_index.vector_stores.awadb import AwaDBVectorStore
-from llama_index.vector_stores.bagel import BagelVectorStore
-from llama_index.vector_stores.cassandra import CassandraVectorStore
-from llama_index.vector_stores.chatgpt_plugin import ChatGPTRetrievalPluginClient
-from llama_index.vector_stores.chroma import ChromaVectorStore
-from llama_index.vector_stores.cogsearch import CognitiveSearchVectorStore
-from llama_index.vector_stores.deeplake import DeepLakeVectorStore
-from llama_index.vector_stores.docarray import (
-    DocArrayHnswVectorStore,
-    DocArrayInMemoryVectorStore,
-)
-from llama_index.vector_stores.elasticsearch import (
-    ElasticsearchStore,
-)
-from llama_index.vector_stores.epsilla import EpsillaVectorStore
-from llama_index.vector_stores.faiss import FaissVectorStore
-from llama_index.vector_stores.lancedb import LanceDBVectorStore
-from llama_index.vector_stores.metal import MetalVectorStore
-from llama_index.vector_stores.milvus import MilvusVectorStore
-from llama_index.vector_stores.myscale import MyScaleVectorStore
-from llama_index.vector_stores.neo4jvector import Neo4jVectorStore
-from llama_index.vector_stores.opensearch import (
-    OpensearchVectorClient,
-    OpensearchVectorStore,
-)
-from llama_index.vector_stores.pinecone import PineconeVectorStore
-from llama_index.vector_stores.postgres import PGVectorStore
-from llama_index.vector_stores.qdrant import QdrantVectorStore
-from llama_index.vector_stores.redis import RedisVectorStore
-from llama_index.vector_stores.rocksetdb import RocksetVectorStore
 from llama_index.vector_stores.simple import SimpleVectorStore
-from llama_index.vector_stores.supabase import SupabaseVectorStore
-from llama_index.vector_stores.tair import TairVectorStore
-from llama_index.vector_stores.timescalevector import TimescaleVectorStore
 from llama_index.vector_stores.types import (
     MetadataFilters,
     VectorStoreQuery,
     VectorStoreQueryResult,
 )
-from llama_index.vector_stores.weaviate import WeaviateVectorStore
+
+if TYPE_CHECKING:
+    from llama_index.vector_stores.awadb import AwaDBVectorStore
+    from llama_index.vector_stores.bagel import BagelVectorStore
+    from llama_index.vector_stores.cassandra import CassandraVectorStore
+    from llama_index.vector_stores.chatgpt_plugin import ChatGPTRetrievalPluginClient
+    from llama_index.vector_stores.chroma import ChromaVectorStore
+    from llama_index.vector_stores.cogsearch import CognitiveSearchVectorStore
+    from llama_index.vector_stores.deeplake import DeepLakeVectorStore
+    from llama_index.vector_stores.docarray import (
+        DocArrayHnswVectorStore,
+        DocArrayInMemoryVectorStore,
+    )
+    from llama_index.vector_stores.elasticsearch import ElasticsearchStore
+    from llama_index.vector_stores.epsilla import EpsillaVectorStore
+    from llama_index.vector_stores.faiss import FaissVectorStore
+    from llama_index.vector_stores.lancedb import LanceDBVectorStore
+    from llama_index.vector_stores.metal import MetalVectorStore
+    from llama_index.vector_stores.milvus import MilvusVectorStore
+    from llama_index.vector_stores.myscale import MyScaleVectorStore
+    from llama_index.vector_stores.neo4jvector import Neo4jVectorStore
+    from llama_index.vector_stores.opensearch import (
+        OpensearchVectorClient,
+        OpensearchVectorStore,
+    )
+    from llama_index.vector_stores.pinecone import PineconeVectorStore
+    from llama_index.vector_stores.postgres import PGVectorStore
+    from llama_index.vector_stores.qdrant import QdrantVectorStore
+    from llama_index.vector_stores.redis import RedisVectorStore
+    from llama_index.vector_stores.rocksetdb import RocksetVectorStore
+    from llama_index.vector_stores.supabase import SupabaseVectorStore
+    from llama_index.vector_stores.tair import TairVectorStore
+    from llama_index.vector_stores.timescalevector import TimescaleVectorStore
+    from llama_index.vector_stores.weaviate import WeaviateVectorStore
+    from llama_index.vector_stores.zep import ZepVectorStore
+
+# integrations are imported on first access, so importing any submodule (e.g.
+# vector_stores.types) does not load every backend module
+_LAZY_IMPORTS = {
+    "AwaDBVectorStore": "awadb",
+    "BagelVectorStore": "bagel",
+    "CassandraVectorStore": "cassandra",
+    "ChatGPTRetrievalPluginClient": "chatgpt_plugin",
+    "ChromaVectorStore": "chroma",
+    "CognitiveSearchVectorStore": "cogsearch",
+    "DeepLakeVectorStore": "deeplake",
+    "DocArrayHnswVectorStore": "docarray",
+    "DocArrayInMemoryVectorStore": "docarray",
+    "ElasticsearchStore": "elasticsearch",
+    "EpsillaVectorStore": "epsilla",
+    "FaissVectorStore": "faiss",
+    "LanceDBVectorStore": "lancedb",
+    "MetalVectorStore": "metal",
+    "MilvusVectorStore": "milvus",
+    "MyScaleVectorStore": "myscale",
+    "Neo4jVectorStore": "neo4jvector",
+    "OpensearchVectorClient": "opensearch",
+    "OpensearchVectorStore": "opensearch",
+    "PineconeVectorStore": "pinecone",
+    "PGVectorStore": "postgres",
+    "QdrantVectorStore": "qdrant",
+    "RedisVectorStore": "redis",
+    "RocksetVectorStore": "rocksetdb",
+    "SupabaseVectorStore": "supabase",
+    "TairVectorStore": "tair",
+    "TimescaleVectorStore": "timescalevector",
+    "WeaviateVectorStore": "weaviate",
+    "ZepVectorStore": "zep",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}")
+    return getattr(module, name)
+
 
 __all__ = [
     "ElasticsearchStore",
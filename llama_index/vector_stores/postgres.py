@@ -1,5 +1,5 @@
 import logging
-from typing import Any, List, NamedTuple, Optional, Type
+from typing import Any, Dict, List, NamedTuple, Optional, Type
 
 from llama_index.bridge.pydantic import PrivateAttr
 from llama_index.schema import BaseNode, MetadataMode, TextNode
@@ -23,6 +23,10 @@ class DBEmbeddingRow(NamedTuple):
 _logger = logging.getLogger(__name__)
 
 
+def _embedding_index_name(index_name: str) -> str:
+    return "%s_embedding_idx" % index_name
+
+
 def get_data_model(
     base: Type,
     index_name: str,
@@ -30,6 +34,8 @@ def get_data_model(
     text_search_config: str,
     cache_okay: bool,
     embed_dim: int = 1536,
+    hnsw_m: Optional[int] = None,
+    hnsw_ef_construction: Optional[int] = None,
 ) -> Any:
     """
     This part create a dynamic sqlalchemy model with a new table.
@@ -83,6 +89,20 @@ def get_data_model(
 
         model = type(class_name, (AbstractData,), {"__tablename__": tablename})
 
+    if hnsw_m is not None or hnsw_ef_construction is not None:
+        # ANN index for the dense query, which orders by cosine distance;
+        # unset build params fall back to the pgvector defaults
+        hnsw_with = {"m": hnsw_m, "ef_construction": hnsw_ef_construction}
+        Index(
+            _embedding_index_name(index_name),
+            model.embedding,  # type: ignore
+            postgresql_using="hnsw",
+            postgresql_with={
+                key: value for key, value in hnsw_with.items() if value is not None
+            },
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        )
+
     return model
 
 
@@ -100,6 +120,8 @@ class PGVectorStore(BasePydanticVectorStore):
     text_search_config: str
     cache_ok: bool
     debug: bool
+    hnsw_m: Optional[int]
+    hnsw_ef_construction: Optional[int]
 
     _base: Any = PrivateAttr()
     _table_class: Any = PrivateAttr()
@@ -119,6 +141,8 @@ class PGVectorStore(BasePydanticVectorStore):
         embed_dim: int = 1536,
         cache_ok: bool = False,
         debug: bool = False,
+        hnsw_m: Optional[int] = None,
+        hnsw_ef_construction: Optional[int] = None,
     ) -> None:
         try:
             import asyncpg
@@ -151,6 +175,8 @@ class PGVectorStore(BasePydanticVectorStore):
             text_search_config,
             cache_ok,
             embed_dim=embed_dim,
+            hnsw_m=hnsw_m,
+            hnsw_ef_construction=hnsw_ef_construction,
         )
 
         super().__init__(
@@ -162,6 +188,8 @@ class PGVectorStore(BasePydanticVectorStore):
             embed_dim=embed_dim,
             cache_ok=cache_ok,
             debug=debug,
+            hnsw_m=hnsw_m,
+            hnsw_ef_construction=hnsw_ef_construction,
         )
 
     async def close(self) -> None:
@@ -193,8 +221,15 @@ class PGVectorStore(BasePydanticVectorStore):
         embed_dim: int = 1536,
         cache_ok: bool = False,
         debug: bool = False,
+        hnsw_m: Optional[int] = None,
+        hnsw_ef_construction: Optional[int] = None,
     ) -> "PGVectorStore":
-        """Return connection string from database parameters."""
+        """Return connection string from database parameters.
+
+        Pass `hnsw_m` and/or `hnsw_ef_construction` to create an HNSW index on the
+        embedding column; it is also added to an existing table that lacks it,
+        which can take a while on a large table. Requires pgvector >= 0.5.0.
+        """
         conn_str = (
             connection_string
             or f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}"
@@ -211,6 +246,8 @@ class PGVectorStore(BasePydanticVectorStore):
             embed_dim=embed_dim,
             cache_ok=cache_ok,
             debug=debug,
+            hnsw_m=hnsw_m,
+            hnsw_ef_construction=hnsw_ef_construction,
         )
 
     @property
@@ -231,8 +268,14 @@ class PGVectorStore(BasePydanticVectorStore):
         self._async_session = sessionmaker(self._async_engine, class_=AsyncSession)  # type: ignore
 
     def _create_tables_if_not_exists(self) -> None:
+        from sqlalchemy.schema import CreateIndex
+
         with self._session() as session, session.begin():
             self._base.metadata.create_all(session.connection())
+            # create_all skips the indexes of a table that already exists
+            for index in self._table_class.__table__.indexes:
+                if index.name == _embedding_index_name(self.table_name):
+                    session.execute(CreateIndex(index, if_not_exists=True))
 
     def _create_extension(self) -> None:
         import sqlalchemy
@@ -249,39 +292,43 @@ class PGVectorStore(BasePydanticVectorStore):
             self._create_tables_if_not_exists()
             self._is_initialized = True
 
-    def _node_to_table_row(self, node: BaseNode) -> Any:
-        return self._table_class(
-            node_id=node.node_id,
-            embedding=node.get_embedding(),
-            text=node.get_content(metadata_mode=MetadataMode.NONE),
-            metadata_=node_to_metadata_dict(
+    def _node_to_table_row(self, node: BaseNode) -> Dict[str, Any]:
+        return {
+            "node_id": node.node_id,
+            "embedding": node.get_embedding(),
+            "text": node.get_content(metadata_mode=MetadataMode.NONE),
+            "metadata_": node_to_metadata_dict(
                 node,
                 remove_text=True,
                 flat_metadata=self.flat_metadata,
             ),
-        )
+        }
 
     def add(self, nodes: List[BaseNode]) -> List[str]:
+        from sqlalchemy import insert
+
         self._initialize()
-        ids = []
+        if not nodes:
+            return []
+        # serialize rows before opening the transaction to keep it short
+        rows = [self._node_to_table_row(node) for node in nodes]
         with self._session() as session, session.begin():
-            for node in nodes:
-                ids.append(node.node_id)
-                item = self._node_to_table_row(node)
-                session.add(item)
+            # a single executemany insert instead of a unit-of-work flush per row
+            session.execute(insert(self._table_class), rows)
             session.commit()
-        return ids
+        return [node.node_id for node in nodes]
 
     async def async_add(self, nodes: List[BaseNode]) -> List[str]:
+        from sqlalchemy import insert
+
         self._initialize()
-        ids = []
+        if not nodes:
+            return []
+        rows = [self._node_to_table_row(node) for node in nodes]
         async with self._async_session() as session, session.begin():
-            for node in nodes:
-                ids.append(node.node_id)
-                item = self._node_to_table_row(node)
-                session.add(item)
+            await session.execute(insert(self._table_class), rows)
             await session.commit()
-        return ids
+        return [node.node_id for node in nodes]
 
     def _apply_filters_and_limit(
         self,
@@ -302,6 +349,15 @@ class PGVectorStore(BasePydanticVectorStore):
                 )
         return stmt.limit(limit)  # type: ignore
 
+    def _select_columns(self) -> List[Any]:
+        # only the columns needed to rebuild nodes; the embedding itself is not
+        # read back on query
+        return [
+            self._table_class.node_id,
+            self._table_class.text,
+            self._table_class.metadata_,
+        ]
+
     def _build_query(
         self,
         embedding: Optional[List[float]],
@@ -310,9 +366,12 @@ class PGVectorStore(BasePydanticVectorStore):
     ) -> Any:
         from sqlalchemy import select
 
-        stmt = select(  # type: ignore
-            self._table_class, self._table_class.embedding.cosine_distance(embedding)
-        ).order_by(self._table_class.embedding.cosine_distance(embedding))
+        # order by the selected distance so the vector is only bound once
+        distance = self._table_class.embedding.cosine_distance(embedding).label(
+            "distance"
+        )
+        stmt = select(*self._select_columns(), distance)  # type: ignore
+        stmt = stmt.order_by(distance)
 
         return self._apply_filters_and_limit(stmt, limit, metadata_filters)
 
@@ -329,12 +388,12 @@ class PGVectorStore(BasePydanticVectorStore):
             )
             return [
                 DBEmbeddingRow(
-                    node_id=item.node_id,
-                    text=item.text,
-                    metadata=item.metadata_,
+                    node_id=node_id,
+                    text=text,
+                    metadata=metadata,
                     similarity=(1 - distance) if distance is not None else 0,
                 )
-                for item, distance in res.all()
+                for node_id, text, metadata, distance in res
             ]
 
     async def _aquery_with_score(
@@ -348,12 +407,12 @@ class PGVectorStore(BasePydanticVectorStore):
             res = await async_session.execute(stmt)
             return [
                 DBEmbeddingRow(
-                    node_id=item.node_id,
-                    text=item.text,
-                    metadata=item.metadata_,
+                    node_id=node_id,
+                    text=text,
+                    metadata=metadata,
                     similarity=(1 - distance) if distance is not None else 0,
                 )
-                for item, distance in res.all()
+                for node_id, text, metadata, distance in res
             ]
 
     def _build_sparse_query(
@@ -378,7 +437,7 @@ class PGVectorStore(BasePydanticVectorStore):
         )
         stmt = (
             select(  # type: ignore
-                self._table_class,
+                *self._select_columns(),
                 func.ts_rank(self._table_class.text_search_tsv, ts_query).label("rank"),
             )
             .where(self._table_class.text_search_tsv.op("@@")(ts_query))
@@ -399,12 +458,12 @@ class PGVectorStore(BasePydanticVectorStore):
             res = await async_session.execute(stmt)
             return [
                 DBEmbeddingRow(
-                    node_id=item.node_id,
-                    text=item.text,
-                    metadata=item.metadata_,
+                    node_id=node_id,
+                    text=text,
+                    metadata=metadata,
                     similarity=rank,
                 )
-                for item, rank in res.all()
+                for node_id, text, metadata, rank in res
             ]
 
     def _sparse_query_with_rank(
@@ -418,12 +477,12 @@ class PGVectorStore(BasePydanticVectorStore):
             res = session.execute(stmt)
             return [
                 DBEmbeddingRow(
-                    node_id=item.node_id,
-                    text=item.text,
-                    metadata=item.metadata_,
+                    node_id=node_id,
+                    text=text,
+                    metadata=metadata,
                     similarity=rank,
                 )
-                for item, rank in res.all()
+                for node_id, text, metadata, rank in res
             ]
 
     async def _async_hybrid_query(
@@ -546,10 +605,10 @@ class PGVectorStore(BasePydanticVectorStore):
         with self._session() as session, session.begin():
             stmt = sqlalchemy.text(
                 f"DELETE FROM public.data_{self.table_name} where "
-                f"(metadata_->>'doc_id')::text = '{ref_doc_id}' "
+                "(metadata_->>'doc_id')::text = :ref_doc_id"
             )
 
-            session.execute(stmt)
+            session.execute(stmt, {"ref_doc_id": ref_doc_id})
             session.commit()
 
 
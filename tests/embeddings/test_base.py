@@ -3,9 +3,15 @@ import os
 from typing import Any, List
 from unittest.mock import patch
 
+import numpy as np
 import openai
 import pytest
-from llama_index.embeddings.base import SimilarityMode, mean_agg
+from llama_index.embeddings.base import (
+    SimilarityMode,
+    mean_agg,
+    similarity,
+    similarity_batch,
+)
 from llama_index.embeddings.openai import OpenAIEmbedding
 
 from tests.conftest import CachedOpenAIApiKeys
@@ -93,6 +99,21 @@ def test_embedding_similarity_euclidean() -> None:
     assert euclidean_similarity1 < euclidean_similarity2
 
 
+@pytest.mark.parametrize(
+    "mode",
+    [SimilarityMode.DEFAULT, SimilarityMode.DOT_PRODUCT, SimilarityMode.EUCLIDEAN],
+)
+def test_similarity_batch(mode: SimilarityMode) -> None:
+    """Test batched similarity matches the per-pair similarity."""
+    query_embedding = [1.0, 2.0, 0.5]
+    embeddings = [[3.0, 4.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.5, 2.0]]
+    result = similarity_batch(
+        np.array(query_embedding), np.array(embeddings), mode=mode
+    )
+    expected = [similarity(query_embedding, emb, mode=mode) for emb in embeddings]
+    assert np.allclose(result, expected)
+
+
 def test_mean_agg() -> None:
     """Test mean aggregation for embeddings."""
     embedding_0 = [3.0, 4.0, 0.0]
@@ -1,11 +1,17 @@
 """LLM predictor tests."""
+import asyncio
 from typing import Any
 from unittest.mock import patch
 
+import pytest
+from llama_index.callbacks import CallbackManager, LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType
 from llama_index.llm_predictor.structured import LLMPredictor, StructuredLLMPredictor
+from llama_index.llm_predictor.utils import abatch_tokens
+from llama_index.llms.mock import MockLLM
 from llama_index.prompts import BasePromptTemplate
 from llama_index.prompts.base import PromptTemplate
-from llama_index.types import BaseOutputParser
+from llama_index.types import BaseOutputParser, TokenAsyncGen
 
 
 class MockOutputParser(BaseOutputParser):
@@ -39,3 +45,91 @@ def test_struct_llm_predictor(mock_init: Any, mock_predict: Any) -> None:
     prompt = PromptTemplate("{query_str}")
     llm_prediction = llm_predictor.predict(prompt, query_str="hello world")
     assert llm_prediction == "hello world"
+
+
+def test_batch_predict() -> None:
+    """Test batch predict preserves the order of the prompts."""
+    llm_predictor = LLMPredictor(llm=MockLLM())
+    prompt = PromptTemplate("{query_str}")
+    prompt_args_list = [{"query_str": f"query {i}"} for i in range(5)]
+
+    outputs = llm_predictor.batch_predict(
+        [prompt] * 5, prompt_args_list=prompt_args_list, max_concurrency=2
+    )
+    assert outputs == [f"query {i}" for i in range(5)]
+
+    with pytest.raises(ValueError):
+        llm_predictor.batch_predict([prompt], prompt_args_list=prompt_args_list)
+
+
+@pytest.mark.asyncio()
+async def test_astream_is_incremental() -> None:
+    """Test astream hands back tokens as they are generated."""
+    llm_predictor = LLMPredictor(llm=MockLLM())
+    prompt = PromptTemplate("{query_str}")
+
+    stream_tokens = await llm_predictor.astream(prompt, query_str="hello")
+    # the first token is available before the rest of the stream is consumed
+    assert await stream_tokens.__anext__() == "h"
+    assert [token async for token in stream_tokens] == list("ello")
+
+
+def test_metadata_follows_llm() -> None:
+    llm = MockLLM(max_tokens=10)
+    llm_predictor = LLMPredictor(llm=llm)
+    assert llm_predictor.metadata.num_output == 10
+
+    llm.max_tokens = 20
+    assert llm_predictor.metadata.num_output == 20
+
+
+def test_system_message_reused() -> None:
+    """Test the system prompt message is stable across calls."""
+    llm_predictor = LLMPredictor(llm=MockLLM(), system_prompt="system")
+    messages = llm_predictor._extend_messages([])
+    assert llm_predictor._extend_messages([])[0] is messages[0]
+
+    llm_predictor.system_prompt = "new system"
+    assert llm_predictor._extend_messages([])[0].content == "new system"
+
+
+@pytest.mark.asyncio()
+async def test_abatch_tokens() -> None:
+    """Test wrapping an astream with abatch_tokens coalesces its tokens."""
+    llm_predictor = LLMPredictor(llm=MockLLM())
+    prompt = PromptTemplate("{query_str}")
+
+    stream_tokens = await llm_predictor.astream(prompt, query_str="hello")
+    stream_tokens = await abatch_tokens(stream_tokens, max_tokens=2)
+    assert [token async for token in stream_tokens] == ["he", "ll", "o"]
+
+
+@pytest.mark.asyncio()
+async def test_abatch_tokens_flushes_on_delay() -> None:
+    """Test buffered tokens are flushed once the delay bound passes."""
+
+    async def slow_tokens() -> TokenAsyncGen:
+        yield "a"
+        yield "b"
+        await asyncio.sleep(0.05)
+        yield "c"
+
+    stream_tokens = await abatch_tokens(slow_tokens(), max_tokens=8, max_delay_ms=10)
+    assert [token async for token in stream_tokens] == ["ab", "c"]
+
+
+def test_log_template_data_skipped_without_handlers() -> None:
+    """Test the templating payload is only built when a handler listens."""
+    prompt = PromptTemplate("{query_str}")
+
+    llm_predictor = LLMPredictor(llm=MockLLM())
+    with patch.object(PromptTemplate, "get_template") as mock_get_template:
+        llm_predictor.predict(prompt, query_str="hello")
+    mock_get_template.assert_not_called()
+
+    handler = LlamaDebugHandler()
+    llm_predictor = LLMPredictor(
+        llm=MockLLM(), callback_manager=CallbackManager([handler])
+    )
+    llm_predictor.predict(prompt, query_str="hello")
+    assert len(handler.get_event_pairs(CBEventType.TEMPLATING)) == 1
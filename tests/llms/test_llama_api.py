@@ -0,0 +1,197 @@
+import asyncio
+import importlib.util
+import json
+import sys
+from typing import Any, Callable, List
+
+import pytest
+from llama_index.llms import llama_api
+from llama_index.llms.base import ChatMessage
+from llama_index.llms.llama_api import LlamaAPI
+
+try:
+    import httpx
+    import llamaapi
+except ImportError:
+    httpx = None  # type: ignore
+    llamaapi = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with the orjson helpers and with the stdlib json fallback."""
+    if request.param == "orjson":
+        if orjson is None:
+            pytest.skip("orjson not installed")
+        return request.param
+
+    # load a separate copy of the module with orjson hidden to get the fallback
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location(
+        "_llama_api_without_orjson", llama_api.__file__
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(llama_api, "_json_dumps", module._json_dumps)
+    monkeypatch.setattr(llama_api, "_json_loads", module._json_loads)
+    return request.param
+
+
+def test_json_helpers(json_backend: str) -> None:
+    data = {"messages": [{"role": "user", "content": "hi"}]}
+    dumped = llama_api._json_dumps(data)
+    assert isinstance(dumped, bytes)
+    assert llama_api._json_loads(dumped) == data
+    assert llama_api._json_loads(dumped.decode("utf-8")) == data
+
+
+def patch_async_clients(
+    monkeypatch: pytest.MonkeyPatch, handler: Callable[[Any], Any]
+) -> List[Any]:
+    """Serve async LlamaAPI calls from handler, recording each client created."""
+    clients: List[Any] = []
+    async_client_cls = httpx.AsyncClient
+
+    def async_client(**kwargs: Any) -> Any:
+        client = async_client_cls(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", async_client)
+    return clients
+
+
+def mock_chat_response(request: Any) -> Any:
+    request_dict = json.loads(request.content)
+    return httpx.Response(
+        200,
+        json={
+            "choices": [
+                {
+                    "message": {
+                        "role": "assistant",
+                        "content": f"echo: {request_dict['messages'][-1]['content']}",
+                    }
+                }
+            ]
+        },
+    )
+
+
+@pytest.mark.skipif(
+    httpx is None or llamaapi is None, reason="httpx or llamaapi not installed"
+)
+@pytest.mark.asyncio()
+async def test_achat(json_backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = LlamaAPI(api_key="fake")
+    patch_async_clients(monkeypatch, mock_chat_response)
+
+    response = await llm.achat([ChatMessage(role="user", content="hello")])
+    assert response.message.content == "echo: hello"
+
+    completion = await llm.acomplete("hello")
+    assert completion.text == "echo: hello"
+
+
+@pytest.mark.skipif(
+    httpx is None or llamaapi is None, reason="httpx or llamaapi not installed"
+)
+def test_achat_async_client_per_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = LlamaAPI(api_key="fake")
+    clients = patch_async_clients(monkeypatch, mock_chat_response)
+
+    async def achat_all(contents: List[str]) -> List[str]:
+        responses = await asyncio.gather(
+            *[
+                llm.achat([ChatMessage(role="user", content=content)])
+                for content in contents
+            ]
+        )
+        return [response.message.content or "" for response in responses]
+
+    # NOTE: the llamaapi client applies nest_asyncio, which makes asyncio.run reuse
+    # one loop, so run each batch on an explicitly new loop instead
+    for contents in [["a", "b", "c"], ["d", "e"]]:
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(achat_all(contents)) == [
+                f"echo: {content}" for content in contents
+            ]
+        finally:
+            loop.close()
+
+    # one client per event loop, and the closed loop's client is dropped
+    assert len(clients) == 2
+    assert list(llm._async_clients.values()) == [clients[1]]
+
+
+def mock_stream_chat_response(request: Any) -> Any:
+    chunks = [
+        {"choices": [{"delta": {"role": "assistant", "content": "hel"}}]},
+        {"choices": [{"delta": {"content": "lo"}}]},
+    ]
+    body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks)
+    return httpx.Response(200, text=body + "data: [DONE]\n\n")
+
+
+@pytest.mark.skipif(
+    httpx is None or llamaapi is None, reason="httpx or llamaapi not installed"
+)
+@pytest.mark.asyncio()
+async def test_astream_chat(json_backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = LlamaAPI(api_key="fake")
+    clients = patch_async_clients(monkeypatch, mock_stream_chat_response)
+
+    response_gen = await llm.astream_chat([ChatMessage(role="user", content="hi")])
+    responses = [response async for response in response_gen]
+    assert [response.delta for response in responses] == ["hel", "lo"]
+    assert responses[-1].message.content == "hello"
+    assert len(clients) == 1
+
+
+class MockStreamResponse:
+    """Minimal stand-in for a streamed `requests.Response`."""
+
+    status_code = 200
+
+    def __init__(self, lines: List[bytes]) -> None:
+        self._lines = lines
+
+    def __enter__(self) -> "MockStreamResponse":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def iter_lines(self) -> List[bytes]:
+        return self._lines
+
+
+@pytest.mark.skipif(llamaapi is None, reason="llamaapi not installed")
+def test_stream_chat(json_backend: str, mocker: Any) -> None:
+    chunks = [
+        {"choices": [{"delta": {"role": "assistant", "content": "hel"}}]},
+        {"choices": []},
+        {"choices": [{"delta": {"content": "lo"}}]},
+    ]
+    lines = [f"data: {json.dumps(chunk)}".encode() for chunk in chunks]
+    # blank keep-alive lines and the [DONE] sentinel are skipped, not parsed
+    lines += [b"", b"data: [DONE]", b""]
+    mock_post = mocker.patch("requests.post", return_value=MockStreamResponse(lines))
+
+    llm = LlamaAPI(api_key="fake")
+    responses = list(llm.stream_chat([ChatMessage(role="user", content="hi")]))
+    assert [response.delta for response in responses] == ["hel", "lo"]
+    assert [response.message.content for response in responses] == ["hel", "hello"]
+    assert responses[-1].message.role == "assistant"
+    assert mock_post.call_args.kwargs["stream"] is True
+    assert json.loads(mock_post.call_args.kwargs["data"])["stream"] is True
+
+    completions = list(llm.stream_complete("hi"))
+    assert completions[-1].text == "hello"
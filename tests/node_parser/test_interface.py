@@ -0,0 +1,51 @@
+from typing import Dict, List, Sequence
+
+import pytest
+from llama_index.callbacks import CallbackManager
+from llama_index.callbacks.schema import CBEventType
+from llama_index.node_parser.interface import BaseExtractor
+from llama_index.node_parser.simple import SimpleNodeParser
+from llama_index.schema import BaseNode, Document, TextNode
+
+
+class LengthExtractor(BaseExtractor):
+    """Extract the text length of each node, inside a callback event."""
+
+    callback_manager: CallbackManager
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "LengthExtractor"
+
+    def extract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        with self.callback_manager.event(CBEventType.CHUNKING):
+            return [{"length": len(node.get_content())} for node in nodes]
+
+
+@pytest.mark.asyncio()
+async def test_aget_nodes_from_documents_nests_events() -> None:
+    callback_manager = CallbackManager([])
+    node_parser = SimpleNodeParser.from_defaults(callback_manager=callback_manager)
+    documents = [Document(text=f"This is document {i}.") for i in range(3)]
+
+    with callback_manager.event(CBEventType.QUERY, event_id="outer"):
+        await node_parser.aget_nodes_from_documents(documents)
+
+    # each document's NODE_PARSING event is a child of the caller's open event
+    assert len(callback_manager._trace_map["outer"]) == len(documents)
+    assert callback_manager._trace_map["root"] == ["outer"]
+
+
+@pytest.mark.asyncio()
+async def test_aextract() -> None:
+    callback_manager = CallbackManager([])
+    extractor = LengthExtractor(callback_manager=callback_manager)
+    nodes: List[BaseNode] = [TextNode(text="a"), TextNode(text="abc")]
+
+    with callback_manager.event(CBEventType.QUERY, event_id="outer"):
+        metadata_list = await extractor.aextract(nodes)
+
+    assert metadata_list == [{"length": 1}, {"length": 3}]
+    # the CHUNKING event from the worker thread nests under the caller's event
+    assert len(callback_manager._trace_map["outer"]) == 1
+    assert callback_manager._trace_map["root"] == ["outer"]
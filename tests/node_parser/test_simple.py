@@ -0,0 +1,22 @@
+import pytest
+from llama_index.node_parser.simple import SimpleNodeParser
+from llama_index.schema import Document
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("show_progress", [False, True])
+async def test_aget_nodes_from_documents(show_progress: bool) -> None:
+    node_parser = SimpleNodeParser.from_defaults()
+    documents = [
+        Document(text=f"This is document {i}.", id_=f"doc_{i}") for i in range(5)
+    ]
+
+    nodes = await node_parser.aget_nodes_from_documents(
+        documents, show_progress=show_progress, max_concurrency=2
+    )
+    sync_nodes = node_parser.get_nodes_from_documents(documents)
+
+    assert [node.ref_doc_id for node in nodes] == [f"doc_{i}" for i in range(5)]
+    assert [node.get_content() for node in nodes] == [
+        node.get_content() for node in sync_nodes
+    ]
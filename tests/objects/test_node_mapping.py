@@ -64,3 +64,22 @@ def test_tool_object_node_mapping() -> None:
         "Tool name: test_tool3\n" "Tool description: test3\n"
     ) in node_mapping.to_node(tool3).get_text()
     assert node_mapping.from_node(node_mapping.to_node(tool3)) == tool3
+
+    # nodes are built once per tool
+    assert node_mapping.to_node(tool1) is node_mapping.to_node(tool1)
+
+    # tools that were never added are converted without being cached
+    tool4 = FunctionTool.from_defaults(fn=lambda x: x, name="test_tool4")
+    assert node_mapping.to_node(tool4) is not node_mapping.to_node(tool4)
+
+    # cached nodes are rebuilt when the tool's metadata changes
+    tool1.metadata.description = "updated"
+    assert "Tool description: updated\n" in node_mapping.to_node(tool1).get_text()
+
+    # re-adding a tool under an existing name replaces its node
+    tool5 = FunctionTool.from_defaults(
+        fn=lambda x: x, name="test_tool", description="new"
+    )
+    node_mapping.add_object(tool5)
+    assert "Tool description: new\n" in node_mapping.to_node(tool5).get_text()
+    assert node_mapping.from_node(node_mapping.to_node(tool5)) == tool5
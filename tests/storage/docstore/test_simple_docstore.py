@@ -62,3 +62,16 @@ def test_docstore_dict() -> None:
     assert gd1 == doc
     gd2 = new_docstore.get_document("d2")
     assert gd2 == node
+
+
+def test_docstore_get_nodes(simple_docstore: SimpleDocumentStore) -> None:
+    node1 = TextNode(text="node one", id_="n1")
+    node2 = TextNode(text="node two", id_="n2")
+
+    docstore = simple_docstore
+    docstore.add_documents([node1, node2])
+    assert docstore.get_nodes(["n2", "n1"]) == [node2, node1]
+    assert docstore.get_node_dict({0: "n1", 1: "n2"}) == {0: node1, 1: node2}
+
+    with pytest.raises(ValueError):
+        docstore.get_nodes(["n1", "missing"])
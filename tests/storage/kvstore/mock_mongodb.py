@@ -15,9 +15,16 @@ class MockMongoCollection:
         return None
 
     def find(self, filter: Optional[dict] = None) -> List[dict]:
+        def _matches(data: dict, key: str, val: Any) -> bool:
+            if isinstance(val, dict) and "$in" in val:
+                return data[key] in val["$in"]
+            return data[key] == val
+
         data_list = []
         for data in self._data.values():
-            if filter is None or all(data[key] == val for key, val in filter.items()):
+            if filter is None or all(
+                _matches(data, key, val) for key, val in filter.items()
+            ):
                 data_list.append(data.copy())
         return data_list
 
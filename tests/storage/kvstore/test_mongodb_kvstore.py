@@ -25,3 +25,6 @@ def test_kvstore_basic(mongo_kvstore: MongoDBKVStore) -> None:
 
     blob = mongo_kvstore.get(test_key, collection="non_existent")
     assert blob is None
+
+    blobs = mongo_kvstore.get_many(["missing", test_key])
+    assert blobs == [None, test_blob]
@@ -1,40 +1,22 @@
 """Test text splitter."""
 import os
+from typing import List
 
+import pytest
 from llama_index.text_splitter import CodeSplitter
 
+skip_in_ci = pytest.mark.skipif(
+    "CI" in os.environ, reason="code splitter tests are not run in CI"
+)
 
-def test_python_code_splitter() -> None:
-    """Test case for code splitting using python."""
-    if "CI" in os.environ:
-        return
-
-    code_splitter = CodeSplitter(
-        language="python", chunk_lines=4, chunk_lines_overlap=1, max_chars=30
-    )
-
-    text = """\
+PYTHON_CODE = """\
 def foo():
     print("bar")
 
 def baz():
     print("bbq")"""
 
-    chunks = code_splitter.split_text(text)
-    assert chunks[0].startswith("def foo():")
-    assert chunks[1].startswith("def baz():")
-
-
-def test_typescript_code_splitter() -> None:
-    """Test case for code splitting using typescript."""
-    if "CI" in os.environ:
-        return
-
-    code_splitter = CodeSplitter(
-        language="typescript", chunk_lines=4, chunk_lines_overlap=1, max_chars=50
-    )
-
-    text = """\
+TYPESCRIPT_CODE = """\
 function foo() {
     console.log("bar");
 }
@@ -43,21 +25,7 @@ function baz() {
     console.log("bbq");
 }"""
 
-    chunks = code_splitter.split_text(text)
-    assert chunks[0].startswith("function foo()")
-    assert chunks[1].startswith("function baz()")
-
-
-def test_html_code_splitter() -> None:
-    """Test case for code splitting using typescript."""
-    if "CI" in os.environ:
-        return
-
-    code_splitter = CodeSplitter(
-        language="html", chunk_lines=4, chunk_lines_overlap=1, max_chars=50
-    )
-
-    text = """\
+HTML_CODE = """\
 <!DOCTYPE html>
 <html>
 <head>
@@ -75,22 +43,7 @@ def test_html_code_splitter() -> None:
 </body>
 </html>"""
 
-    chunks = code_splitter.split_text(text)
-    assert chunks[0].startswith("<!DOCTYPE html>")
-    assert chunks[1].startswith("<html>")
-    assert chunks[2].startswith("<head>")
-
-
-def test_tsx_code_splitter() -> None:
-    """Test case for code splitting using typescript."""
-    if "CI" in os.environ:
-        return
-
-    code_splitter = CodeSplitter(
-        language="typescript", chunk_lines=4, chunk_lines_overlap=1, max_chars=50
-    )
-
-    text = """\
+TSX_CODE = """\
 import React from 'react';
 
 interface Person {
@@ -114,21 +67,7 @@ const ExampleComponent: React.FC = () => {
 
 export default ExampleComponent;"""
 
-    chunks = code_splitter.split_text(text)
-    assert chunks[0].startswith("import React from 'react';")
-    assert chunks[1].startswith("interface Person")
-
-
-def test_cpp_code_splitter() -> None:
-    """Test case for code splitting using typescript."""
-    if "CI" in os.environ:
-        return
-
-    code_splitter = CodeSplitter(
-        language="cpp", chunk_lines=4, chunk_lines_overlap=1, max_chars=50
-    )
-
-    text = """\
+CPP_CODE = """\
 #include <iostream>
 
 int main() {
@@ -136,7 +75,54 @@ int main() {
     return 0;
 }"""
 
+
+@skip_in_ci
+@pytest.mark.parametrize(
+    ("language", "max_chars", "text", "expected_prefixes"),
+    [
+        ("python", 30, PYTHON_CODE, ["def foo():", "def baz():"]),
+        ("typescript", 50, TYPESCRIPT_CODE, ["function foo()", "function baz()"]),
+        ("html", 50, HTML_CODE, ["<!DOCTYPE html>", "<html>", "<head>"]),
+        (
+            "typescript",
+            50,
+            TSX_CODE,
+            ["import React from 'react';", "interface Person"],
+        ),
+        (
+            "cpp",
+            50,
+            CPP_CODE,
+            ["#include <iostream>", "int main()", "{\n    std::cout"],
+        ),
+    ],
+    ids=["python", "typescript", "html", "tsx", "cpp"],
+)
+def test_code_splitter(
+    language: str, max_chars: int, text: str, expected_prefixes: List[str]
+) -> None:
+    """Test case for code splitting in each supported language."""
+    code_splitter = CodeSplitter(
+        language=language, chunk_lines=4, chunk_lines_overlap=1, max_chars=max_chars
+    )
+
     chunks = code_splitter.split_text(text)
-    assert chunks[0].startswith("#include <iostream>")
-    assert chunks[1].startswith("int main()")
-    assert chunks[2].startswith("{\n    std::cout")
+    # one comparison, so a failure reports every mismatching chunk at once
+    prefixes = [
+        chunk[: len(expected_prefix)]
+        for chunk, expected_prefix in zip(chunks, expected_prefixes)
+    ]
+    assert prefixes == expected_prefixes
+
+
+@skip_in_ci
+def test_code_splitter_reuses_parser() -> None:
+    """Test that the parser is loaded on first use and reused afterwards."""
+    code_splitter = CodeSplitter(
+        language="python", chunk_lines=4, chunk_lines_overlap=1, max_chars=30
+    )
+
+    chunks = code_splitter.split_text(PYTHON_CODE)
+    parser = code_splitter._get_parser()
+    assert code_splitter.split_text(PYTHON_CODE) == chunks
+    assert code_splitter._get_parser() is parser
@@ -1,26 +1,32 @@
+from typing import List, Tuple
+from unittest.mock import patch
+
 import tiktoken
 from llama_index.text_splitter import SentenceSplitter
 
+FOO_15 = " ".join(["foo"] * 15)
+BAR_15 = " ".join(["bar"] * 15)
+
 
 def test_paragraphs() -> None:
     """Test case of a string with multiple paragraphs."""
     sentence_text_splitter = SentenceSplitter(chunk_size=20, chunk_overlap=0)
 
-    text = " ".join(["foo"] * 15) + "\n\n\n" + " ".join(["bar"] * 15)
+    text = FOO_15 + "\n\n\n" + BAR_15
     sentence_split = sentence_text_splitter.split_text(text)
-    assert sentence_split[0] == " ".join(["foo"] * 15)
-    assert sentence_split[1] == " ".join(["bar"] * 15)
+    assert sentence_split[0] == FOO_15
+    assert sentence_split[1] == BAR_15
 
 
 def test_sentences() -> None:
     """Test case of a string with multiple sentences."""
     sentence_text_splitter = SentenceSplitter(chunk_size=20, chunk_overlap=0)
 
-    text = " ".join(["foo"] * 15) + ". " + " ".join(["bar"] * 15)
+    text = FOO_15 + ". " + BAR_15
     sentence_split = sentence_text_splitter.split_text(text)
 
-    assert sentence_split[0] == " ".join(["foo"] * 15) + "."
-    assert sentence_split[1] == " ".join(["bar"] * 15)
+    assert sentence_split[0] == FOO_15 + "."
+    assert sentence_split[1] == BAR_15
 
 
 def test_chinese_text(chinese_text: str) -> None:
@@ -86,26 +92,26 @@ def test_split_texts_singleton() -> None:
     """Test case for a singleton list of texts."""
     sentence_text_splitter = SentenceSplitter(chunk_size=20, chunk_overlap=0)
 
-    text = " ".join(["foo"] * 15) + "\n\n\n" + " ".join(["bar"] * 15)
+    text = FOO_15 + "\n\n\n" + BAR_15
     texts = [text]
     sentence_split = sentence_text_splitter.split_texts(texts)
-    assert sentence_split[0] == " ".join(["foo"] * 15)
-    assert sentence_split[1] == " ".join(["bar"] * 15)
+    assert sentence_split[0] == FOO_15
+    assert sentence_split[1] == BAR_15
 
 
 def test_split_texts_multiple() -> None:
     """Test case for a list of texts."""
     sentence_text_splitter = SentenceSplitter(chunk_size=20, chunk_overlap=0)
 
-    text1 = " ".join(["foo"] * 15) + "\n\n\n" + " ".join(["bar"] * 15)
-    text2 = " ".join(["bar"] * 15) + "\n\n\n" + " ".join(["foo"] * 15)
+    text1 = FOO_15 + "\n\n\n" + BAR_15
+    text2 = BAR_15 + "\n\n\n" + FOO_15
     texts = [text1, text2]
     sentence_split = sentence_text_splitter.split_texts(texts)
     print(sentence_split)
-    assert sentence_split[0] == " ".join(["foo"] * 15)
-    assert sentence_split[1] == " ".join(["bar"] * 15)
-    assert sentence_split[2] == " ".join(["bar"] * 15)
-    assert sentence_split[3] == " ".join(["foo"] * 15)
+    assert sentence_split[0] == FOO_15
+    assert sentence_split[1] == BAR_15
+    assert sentence_split[2] == BAR_15
+    assert sentence_split[3] == FOO_15
 
 
 def test_split_texts_with_metadata(english_text: str) -> None:
@@ -124,3 +130,29 @@ def test_split_texts_with_metadata(english_text: str) -> None:
         [english_text, english_text], [metadata_str, metadata_str]
     )
     assert len(chunks) == 8
+
+
+def test_split_tokenizes_each_split_once(english_text: str) -> None:
+    """Test that no split is passed to the tokenizer more than once."""
+    calls: List[str] = []
+    splits: List[str] = [english_text]
+
+    def tokenizer(text: str) -> List[str]:
+        calls.append(text)
+        return text.split()
+
+    get_splits_by_fns = SentenceSplitter._get_splits_by_fns
+
+    def record_splits(self: SentenceSplitter, text: str) -> Tuple[List[str], bool]:
+        text_splits, is_sentence = get_splits_by_fns(self, text)
+        splits.extend(text_splits)
+        return text_splits, is_sentence
+
+    splitter = SentenceSplitter(chunk_size=20, chunk_overlap=5, tokenizer=tokenizer)
+    with patch.object(SentenceSplitter, "_get_splits_by_fns", record_splits):
+        chunks = splitter.split_text(english_text)
+
+    assert len(chunks) > 1
+    # one tokenizer call for the text and for each split of it, at every level;
+    # counted rather than deduplicated, as split texts may repeat
+    assert len(calls) == len(splits)
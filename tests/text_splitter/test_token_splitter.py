@@ -73,3 +73,13 @@ def test_split_with_metadata(english_text: str) -> None:
     for chunk in chunks:
         node_content = chunk + metadata_str
         assert len(tokenizer.encode(node_content)) <= 100
+
+
+def test_split_texts() -> None:
+    """Test that split_texts matches splitting each text on its own."""
+    texts = [" ".join(["foo"] * n) for n in range(1, 50)]
+    text_splitter = TokenTextSplitter(chunk_size=20, chunk_overlap=5)
+    chunks = text_splitter.split_texts(texts)
+    assert chunks == [
+        chunk for text in texts for chunk in text_splitter.split_text(text)
+    ]
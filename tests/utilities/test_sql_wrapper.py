@@ -3,13 +3,28 @@ from typing import Generator
 import pytest
 from llama_index.utilities.sql_wrapper import SQLDatabase
 from pytest_mock import MockerFixture
-from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
-
-
-# Create a fixture for the database instance
-@pytest.fixture()
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    delete,
+)
+from sqlalchemy.pool import StaticPool
+
+
+# Create a fixture for the database instance, shared by the tests in this module
+@pytest.fixture(scope="module")
 def sql_database() -> Generator[SQLDatabase, None, None]:
-    engine = create_engine("sqlite:///:memory:")
+    # a single shared connection, so the in-memory database outlives any one
+    # checkout for the whole module
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     metadata = MetaData()
     table_name = "test_table"
     Table(
@@ -25,6 +40,17 @@ def sql_database() -> Generator[SQLDatabase, None, None]:
     metadata.drop_all(engine)
 
 
+# Empty the test table again after tests that write to it
+@pytest.fixture()
+def clean_sql_database(
+    sql_database: SQLDatabase,
+) -> Generator[SQLDatabase, None, None]:
+    yield sql_database
+
+    with sql_database.engine.begin() as connection:
+        connection.execute(delete(sql_database.metadata_obj.tables["test_table"]))
+
+
 # Test initialization
 def test_init(sql_database: SQLDatabase) -> None:
     assert sql_database.engine
@@ -55,12 +81,35 @@ def test_get_single_table_info(sql_database: SQLDatabase) -> None:
 
 
 # Test insert and run_sql method
-def test_insert_and_run_sql(sql_database: SQLDatabase) -> None:
-    result_str, _ = sql_database.run_sql("SELECT * FROM test_table;")
+def test_insert_and_run_sql(clean_sql_database: SQLDatabase) -> None:
+    result_str, _ = clean_sql_database.run_sql("SELECT * FROM test_table;")
     assert result_str == "[]"
 
-    sql_database.insert_into_table("test_table", {"id": 1, "name": "Paul McCartney"})
+    clean_sql_database.insert_into_table(
+        "test_table", {"id": 1, "name": "Paul McCartney"}
+    )
 
-    result_str, _ = sql_database.run_sql("SELECT * FROM test_table;")
+    result_str, _ = clean_sql_database.run_sql("SELECT * FROM test_table;")
 
     assert result_str == "[(1, 'Paul McCartney')]"
+
+
+# Test insert_into_table_many method
+def test_insert_into_table_many(clean_sql_database: SQLDatabase) -> None:
+    rows = [{"id": i, "name": f"name_{i}"} for i in range(1000)]
+    clean_sql_database.insert_into_table_many("test_table", rows)
+
+    result_str, _ = clean_sql_database.run_sql("SELECT COUNT(*) FROM test_table;")
+    assert result_str == "[(1000,)]"
+
+
+# Test that tables already in the supplied metadata are not reflected again
+def test_init_skips_reflect_for_known_tables(
+    sql_database: SQLDatabase, mocker: MockerFixture
+) -> None:
+    spy = mocker.spy(MetaData, "reflect")
+    SQLDatabase(engine=sql_database.engine, metadata=sql_database.metadata_obj)
+    assert spy.call_count == 0
+
+    SQLDatabase(engine=sql_database.engine)
+    assert spy.call_count == 1
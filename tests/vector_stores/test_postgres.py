@@ -435,3 +435,59 @@ def test_hybrid_query_fails_if_no_query_str_provided(
         pg_hybrid.query(q)
 
         assert str(exc) == "query_str must be specified for a sparse vector query."
+
+
+def test_hnsw_index_ddl() -> None:
+    pytest.importorskip("pgvector")
+    pytest.importorskip("asyncpg")
+    pytest.importorskip("psycopg2")
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    pg = PGVectorStore.from_params(
+        **PARAMS,  # type: ignore
+        database=TEST_DB,
+        table_name=TEST_TABLE_NAME,
+        embed_dim=TEST_EMBED_DIM,
+        hnsw_m=8,
+    )
+    (index,) = pg._table_class.__table__.indexes
+    ddl = str(
+        CreateIndex(index, if_not_exists=True).compile(dialect=postgresql.dialect())
+    )
+    assert ddl == (
+        f"CREATE INDEX IF NOT EXISTS {TEST_TABLE_NAME}_embedding_idx "
+        f"ON data_{TEST_TABLE_NAME} USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 8)"
+    )
+
+
+@pytest.mark.skipif(postgres_not_available, reason="postgres db is not available")
+def test_hnsw_index_added_to_existing_table(
+    pg: PGVectorStore, node_embeddings: List[TextNode]
+) -> None:
+    pg.add(node_embeddings)
+
+    pg_hnsw = PGVectorStore.from_params(
+        **PARAMS,  # type: ignore
+        database=TEST_DB,
+        table_name=TEST_TABLE_NAME,
+        embed_dim=TEST_EMBED_DIM,
+        hnsw_m=16,
+        hnsw_ef_construction=64,
+    )
+    q = VectorStoreQuery(query_embedding=_get_sample_vector(1.0), similarity_top_k=1)
+    res = pg_hnsw.query(q)
+    assert res.nodes
+    assert res.nodes[0].node_id == "aaa"
+
+    with pg_hnsw._session() as session:
+        indexes = session.execute(
+            sqlalchemy.text(
+                "SELECT indexname FROM pg_indexes WHERE tablename = :tablename"
+            ),
+            {"tablename": f"data_{TEST_TABLE_NAME}"},
+        ).scalars()
+        assert f"{TEST_TABLE_NAME}_embedding_idx" in list(indexes)
+
+    asyncio.run(pg_hnsw.close())